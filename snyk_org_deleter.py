@@ -23,93 +23,263 @@ import sys
 import time
 import datetime
 import logging
+import logging.handlers
 import argparse
-from typing import Dict, List, Optional, Tuple
+import atexit
+from typing import Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from queue import Queue
+from urllib3.util.retry import Retry
+import itertools
 import random
 
 
+# orjson decodes the large JSON:API listing pages ~2-3x faster than the
+# stdlib and accepts bytes directly, skipping requests' charset detection.
+# It stays optional; the stdlib decoder is a drop-in fallback.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Sentinel used to tell streaming deletion consumers to shut down
+_QUEUE_SENTINEL = object()
+
+# Shared default for missing 'attributes' dicts so hot loops don't allocate
+# a throwaway {} per item
+_EMPTY = {}
+
+# API base URLs per Snyk region; module-level so instances share one table
+_REGION_URLS = {
+    "SNYK-US-01": "https://api.snyk.io",
+    "SNYK-US-02": "https://api.us.snyk.io",
+    "SNYK-EU-01": "https://api.eu.snyk.io",
+    "SNYK-AU-01": "https://api.au.snyk.io"
+}
+
+
 class RateLimiter:
-    """Handles rate limiting with exponential backoff for 429 responses."""
-    
+    """Handles rate limiting for 429 responses using the server-advised window.
+
+    Backoff is tracked per bucket (org/project/target) so a throttled burst
+    of project deletes does not stall unrelated org deletes.
+    """
+
+    DEFAULT_RETRY_AFTER = 10
+
     def __init__(self):
-        self.lock = threading.Lock()
-        self.last_429_time = 0
-        self.backoff_until = 0
-    
-    def handle_429(self, endpoint: str):
-        """Handle 429 rate limit response with backoff."""
-        with self.lock:
-            current_time = time.time()
-            
-            # If we're already in backoff, extend it
-            if current_time < self.backoff_until:
-                wait_time = self.backoff_until - current_time
-                logging.warning(f"Rate limited on {endpoint}. Waiting {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
-                return
-            
-            # Set backoff for 1 minute (60 seconds)
-            self.backoff_until = current_time + 60
-            logging.warning(f"Rate limited on {endpoint}. Backing off for 60 seconds...")
-            time.sleep(60)
-    
-    def is_in_backoff(self) -> bool:
-        """Check if we're currently in a backoff period."""
-        with self.lock:
-            return time.time() < self.backoff_until
+        self.condition = threading.Condition()
+        self.backoff_until = {}
+
+    def handle_429(self, endpoint: str, response=None, bucket: str = 'default'):
+        """Handle 429 rate limit response by honoring Retry-After."""
+        retry_after = self.DEFAULT_RETRY_AFTER
+        if response is not None:
+            try:
+                retry_after = int(response.headers.get('Retry-After', self.DEFAULT_RETRY_AFTER))
+            except (TypeError, ValueError):
+                pass
+
+        with self.condition:
+            until = time.time() + retry_after
+            if until > self.backoff_until.get(bucket, 0):
+                self.backoff_until[bucket] = until
+                logging.getLogger(__name__).warning(f"Rate limited on {endpoint}. Backing off for {retry_after} seconds...")
+
+            # Wait out the backoff window; Condition.wait releases the lock
+            # so other threads can shorten or observe the window meanwhile
+            while True:
+                remaining = self.backoff_until.get(bucket, 0) - time.time()
+                if remaining <= 0:
+                    break
+                self.condition.wait(timeout=remaining)
+            self.condition.notify_all()
+
+    def is_in_backoff(self, bucket: str = 'default') -> bool:
+        """Check if we're currently in a backoff period.
+
+        Lock-free: reading a single dict entry is atomic under the GIL, and
+        this is called on every retry iteration by every worker, so taking
+        the condition lock here would serialize the hot path for no benefit.
+        Only handle_429, which updates the window, needs the lock.
+        """
+        return time.time() < self.backoff_until.get(bucket, 0)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency controller for deletion requests.
+
+    Workers take a permit around each request and report the response
+    status afterwards. A 429/503 halves the permit count (multiplicative
+    decrease); a long run of consecutive 2xx responses adds one permit
+    back (additive increase), so throughput settles near the API's actual
+    capacity instead of cliff-diving when --max-workers is set too high.
+    """
+
+    RAMP_UP_AFTER = 64  # consecutive successes required per added permit
+
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.permits = cap
+        self.condition = threading.Condition()
+        self.active = 0
+        self._successes = 0
+
+    def acquire(self):
+        """Block until a permit is available, then take it."""
+        with self.condition:
+            while self.active >= self.permits:
+                self.condition.wait()
+            self.active += 1
+
+    def release(self):
+        """Return a permit."""
+        with self.condition:
+            self.active -= 1
+            self.condition.notify()
+
+    def record_status(self, status_code: int):
+        """Adjust the permit count based on an observed response status."""
+        with self.condition:
+            if status_code in (429, 503):
+                self._successes = 0
+                if self.permits > 1:
+                    self.permits = max(1, self.permits // 2)
+                    logging.getLogger(__name__).warning(
+                        f"Throttled ({status_code}). Reducing concurrency to {self.permits} permits")
+            elif 200 <= status_code < 300:
+                self._successes += 1
+                if self._successes >= self.RAMP_UP_AFTER and self.permits < self.cap:
+                    self._successes = 0
+                    self.permits += 1
+                    logging.getLogger(__name__).info(
+                        f"Raising concurrency to {self.permits} permits")
+            self.condition.notify_all()
 
 
 class SnykOrgDeleter:
     """Snyk API client for deleting organizations."""
     
-    def __init__(self, token: str, region: str = "SNYK-US-01", max_workers: int = 5):
+    def __init__(self, token: str, region: str = "SNYK-US-01", max_workers: int = 5,
+                 verbose: bool = False, batch_size: int = 250,
+                 api_version: str = "2024-10-15"):
         self.token = token
         self.base_url = self._get_base_url(region)
         self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.api_version = api_version
+        # Shared params dict for the per-item endpoints; requests copies it
+        # on each call, so sharing one instance is safe and avoids building
+        # a fresh dict per delete
+        self._version_params = {'version': api_version}
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'token {token}',
-            'Content-Type': 'application/vnd.api+json',
             'Accept': '*/*'
         })
-        
-        # Initialize rate limiter
+        # DELETEs send no body, so the session carries no Content-Type;
+        # requests that do send a JSON:API body add this header explicitly
+        self._json_api_headers = {'Content-Type': 'application/vnd.api+json'}
+
+        # Size the connection pool to the worker count so concurrent threads
+        # reuse kept-alive connections instead of serializing on urllib3's
+        # default 10-connection pool (or re-opening TLS connections).
+        pool_size = max(self.max_workers * 2, 20)
+        # Retry GETs at the transport layer so a transient 5xx/429 can't
+        # abort a listing mid-pagination. DELETEs are excluded: they keep
+        # their own retry/backoff logic in _delete_with_retry and must not
+        # be retried twice.
+        get_retries = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET']
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=get_retries
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Initialize rate limiter and adaptive concurrency controller
         self.rate_limiter = RateLimiter()
+        self.adaptive_limiter = AdaptiveLimiter(max_workers)
+
+        # Set once we learn the API has no bulk delete endpoint for the
+        # respective resource, so we only probe for each one time per run
+        self._bulk_delete_unsupported = False
+        self._bulk_target_delete_unsupported = False
+
+        # Org-listing ETag and result cache, keyed by group ID. Only useful
+        # on long-lived runs (--daemon), where an unchanged listing can be
+        # revalidated with one conditional GET instead of re-paginated.
+        self._orgs_etag = {}
+        self._orgs_cache = {}
+
+        # DELETEs answered with 404 mean the item was already gone, usually
+        # cleaned up by a previous partial run. They count as successes, but
+        # are tallied per resource type ('Organization', 'Project', 'Target')
+        # so resumed runs are visible in the summary without conflating
+        # child-cleanup 404s with org-level counts.
+        self._already_gone = {}
+        self._already_gone_lock = threading.Lock()
         
         # Setup logging
-        self.setup_logging()
-        
+        self.setup_logging(verbose)
+
     def _get_base_url(self, region: str) -> str:
         """Get the appropriate API base URL for the region."""
-        region_urls = {
-            "SNYK-US-01": "https://api.snyk.io",
-            "SNYK-US-02": "https://api.us.snyk.io", 
-            "SNYK-EU-01": "https://api.eu.snyk.io",
-            "SNYK-AU-01": "https://api.au.snyk.io"
-        }
-        return region_urls.get(region, "https://api.snyk.io")
+        return _REGION_URLS.get(region, "https://api.snyk.io")
     
-    def setup_logging(self):
-        """Setup logging configuration."""
+    def setup_logging(self, verbose: bool = False):
+        """Setup logging configuration.
+
+        Worker threads only enqueue log records; a single QueueListener
+        thread does the formatting and file/stdout I/O so logging never
+        serializes the deletion workers on handler locks.
+
+        Handlers attach to this module's logger, not the root logger, and
+        only once per process: instantiating the deleter twice must not end
+        up with duplicate handlers printing every line twice.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+        if self.logger.handlers:
+            return
+
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
-        
+
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"org_deletion_{timestamp}.log"
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        log_queue = Queue()
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        # The listener thread is a daemon: without an explicit stop, records
+        # still queued at interpreter exit (e.g. the final summary logged
+        # right before sys.exit) are dropped, and the listener can race
+        # logging.shutdown() closing the file handler
+        atexit.register(self._log_listener.stop)
+
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.logger.propagate = False
         self.logger.info(f"Logging initialized. Log file: {log_file}")
     
     def get_token_details(self, version: str = "2024-10-15") -> Optional[Dict]:
@@ -120,147 +290,401 @@ class SnykOrgDeleter:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return _loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers malformed bodies: _loads raises it (via
+            # json or orjson) rather than requests' JSONDecodeError
             self.logger.error(f"Error fetching token details: {e}")
             return None
     
-    def get_snyk_orgs(self, version: str = "2024-10-15", group_id: Optional[str] = None) -> List[Dict]:
-        """Get all Snyk organizations."""
-        url = f"{self.base_url}/rest/groups/{group_id}/orgs"
-        params = {
-            'version': version,
-            'limit': 100
-        }
-        
-        all_orgs = []
-        next_url = url
-        next_params = params
+    def _resolve_next(self, next_url: str) -> str:
+        """Resolve a pagination 'next' link against the base URL."""
+        if next_url.startswith('http'):
+            return next_url
+        elif next_url.startswith('/'):
+            return self.base_url + next_url
+        else:
+            return self.base_url + '/' + next_url.lstrip('/')
+
+    def _paged_get(self, url: str, params: Dict, label: str = "items",
+                   first_response_hook=None, completion_hook=None):
+        """Iterate a paginated REST endpoint, yielding each page's data list.
+
+        The request for page N+1 is fired on a background thread as soon as
+        page N has been parsed, so the caller's processing of page N overlaps
+        with the fetch of page N+1 and hides one round-trip per page.
+
+        first_response_hook, when given, is called with the first page's
+        response so callers can capture validator headers such as ETag.
+        completion_hook is called with the page count only when the last page
+        was reached without error, so callers can tell a complete listing
+        from a truncated one (and a single-page one from a multi-page one).
+        """
         page = 1
-        
-        while next_url:
-            self.logger.info(f"Fetching orgs page {page}...")
-            try:
-                response = self.session.get(next_url, params=next_params)
-                response.raise_for_status()
-                data = response.json()
-                
-                orgs = data.get('data', [])
-                all_orgs.extend(orgs)
-                
-                # Handle pagination
-                links = data.get('links', {})
-                next_url = links.get('next')
-                next_params = None
-                
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future = executor.submit(self.session.get, url, params=params)
+
+            while future is not None:
+                self.logger.info(f"Fetching {label} page {page}...")
+                try:
+                    response = future.result()
+                    response.raise_for_status()
+                    data = _loads(response.content)
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    # ValueError covers malformed page bodies (e.g. an HTML
+                    # error page served with a 200): _loads raises it rather
+                    # than requests' JSONDecodeError
+                    self.logger.error(f"Error fetching {label} page {page}: {e}")
+                    return
+
+                if page == 1 and first_response_hook is not None:
+                    first_response_hook(response)
+
+                # Kick off the next page before handing back this one
+                next_url = data.get('links', {}).get('next')
                 if next_url:
-                    if next_url.startswith('http'):
-                        pass  # use as-is
-                    elif next_url.startswith('/'):
-                        next_url = self.base_url + next_url
-                    else:
-                        next_url = self.base_url + '/' + next_url.lstrip('/')
+                    future = executor.submit(
+                        self.session.get, self._resolve_next(next_url))
                 else:
-                    next_url = None
-                
+                    future = None
+
+                yield data.get('data', [])
                 page += 1
-                
+
+            if completion_hook is not None:
+                completion_hook(page - 1)
+
+    def _delete_with_retry(self, url: str, params: Optional[Dict] = None,
+                           bucket: str = 'default', label: str = '',
+                           max_retries: int = 3) -> Optional[requests.Response]:
+        """Issue a DELETE with 429 handling and decorrelated-jitter backoff.
+
+        Returns the final response for the caller to interpret, or None when
+        every attempt failed at the transport level. Transport errors and
+        transient 5xx responses both retry with jittered sleeps; they sleep
+        for random.uniform(base, base*3) capped at 30s, with base following
+        the previous sleep, so concurrent workers don't retry in lockstep.
+        """
+        base = 1.0
+        response = None
+
+        for attempt in range(max_retries):
+            # Check if we're in backoff
+            if self.rate_limiter.is_in_backoff(bucket):
+                time.sleep(5 + random.uniform(0, 5))  # Random jitter
+
+            try:
+                self.adaptive_limiter.acquire()
+                try:
+                    response = self.session.delete(url, params=params)
+                finally:
+                    self.adaptive_limiter.release()
             except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error fetching orgs page {page}: {e}")
-                break
-        
+                self.logger.error(f"Error deleting {label}: {e}")
+                if attempt == max_retries - 1:
+                    return None
+                sleep_time = min(30, random.uniform(base, base * 3))
+                base = sleep_time
+                time.sleep(sleep_time)
+                continue
+
+            self.adaptive_limiter.record_status(response.status_code)
+
+            if response.status_code == 429:
+                self.rate_limiter.handle_429(f"DELETE {label}", response, bucket=bucket)
+                continue
+
+            # Transient server errors get the same jittered retry as
+            # transport failures; the session adapter deliberately excludes
+            # DELETE from urllib3 retries, so this is the only retry layer
+            if response.status_code >= 500 and attempt < max_retries - 1:
+                self.logger.warning(
+                    f"DELETE {label} returned {response.status_code}, retrying...")
+                sleep_time = min(30, random.uniform(base, base * 3))
+                base = sleep_time
+                time.sleep(sleep_time)
+                continue
+
+            return response
+
+        return response
+
+    def _stream_delete(self, pages, worker) -> None:
+        """Run worker(item) across items from a paginated generator.
+
+        Items are pushed onto a bounded queue as each page is parsed while
+        long-lived consumer threads pull and delete them, so deletion overlaps
+        with page fetching instead of waiting for the full listing.
+        """
+        work_queue = Queue(maxsize=self.max_workers * 4)
+        completed = itertools.count(1)
+
+        def consume():
+            while True:
+                item = work_queue.get()
+                if item is _QUEUE_SENTINEL:
+                    return
+                worker(item)
+                # Aggregate progress marker; per-item detail lives at DEBUG
+                done = next(completed)
+                if done % 100 == 0:
+                    self.logger.info("  ...%d items processed", done)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            consumers = []
+
+            try:
+                for page in pages:
+                    for item in page:
+                        # Grow the consumer pool lazily: never more consumers
+                        # than items seen (capped at max_workers), so the common
+                        # org with a handful of items doesn't spawn a full
+                        # thread pool for one or two deletes
+                        if len(consumers) < self.max_workers:
+                            consumers.append(executor.submit(consume))
+                        work_queue.put(item)
+            finally:
+                # One sentinel per consumer so each exits its loop. This must
+                # run even when the pages generator raises mid-stream:
+                # otherwise consumers block in get() forever and the
+                # executor's exit join hangs the process
+                for _ in consumers:
+                    work_queue.put(_QUEUE_SENTINEL)
+                for future in consumers:
+                    future.result()
+
+    def iter_snyk_orgs(self, version: str = "2024-10-15", group_id: Optional[str] = None,
+                       first_response_hook=None, completion_hook=None):
+        """Yield Snyk organizations one by one as pages arrive.
+
+        Lets callers start analyzing or deleting after the first page
+        instead of holding the whole group's JSON tree in memory.
+        """
+        url = f"{self.base_url}/rest/groups/{group_id}/orgs"
+        params = {
+            'version': version,
+            'limit': 100
+        }
+
+        for orgs in self._paged_get(url, params, label="orgs",
+                                    first_response_hook=first_response_hook,
+                                    completion_hook=completion_hook):
+            yield from orgs
+
+    def _cached_orgs_if_unchanged(self, version: str, group_id: Optional[str]) -> Optional[List[Dict]]:
+        """Return the cached org list if a conditional GET confirms it is
+        still current, else None (meaning: do a full listing)."""
+        etag = self._orgs_etag.get(group_id)
+        if not etag or group_id not in self._orgs_cache:
+            return None
+
+        url = f"{self.base_url}/rest/groups/{group_id}/orgs"
+        params = {'version': version, 'limit': 100}
+        try:
+            probe = self.session.get(url, params=params,
+                                     headers={'If-None-Match': etag})
+        except requests.exceptions.RequestException:
+            return None
+        if probe.status_code != 304:
+            return None
+
+        cached = self._orgs_cache[group_id]
+        self.logger.info(
+            f"Organization listing unchanged (ETag match); reusing {len(cached)} cached orgs")
+        return cached
+
+    def _commit_orgs_listing(self, group_id: Optional[str], orgs: List[Dict],
+                             etag: Optional[str], complete: bool, pages: int):
+        """Commit or invalidate the org-listing cache after a pagination pass.
+
+        The ETag covers page 1 only, so only single-page listings are
+        cacheable: a 304 on page 1 says nothing about pages 2+, and a stale
+        multi-page cache would skip new orgs on later pages — or worse, keep
+        a stale name for an org renamed into the exclusion list. Truncated
+        listings (pagination aborted mid-stream) are likewise never cached.
+        Anything else clears both the cached list and the ETag.
+        """
+        if complete and pages == 1 and etag:
+            self._orgs_cache[group_id] = orgs
+            self._orgs_etag[group_id] = etag
+        else:
+            self._orgs_cache.pop(group_id, None)
+            self._orgs_etag.pop(group_id, None)
+
+    def get_snyk_orgs(self, version: str = "2024-10-15", group_id: Optional[str] = None) -> List[Dict]:
+        """Get all Snyk organizations.
+
+        Repeat calls in the same process (--daemon) revalidate the listing
+        with the ETag captured from the previous run; a 304 reuses the
+        cached list and skips the full pagination.
+        """
+        cached = self._cached_orgs_if_unchanged(version, group_id)
+        if cached is not None:
+            return cached
+
+        listing = {'etag': None, 'complete': False, 'pages': 0}
+        all_orgs = list(self.iter_snyk_orgs(
+            version, group_id,
+            first_response_hook=lambda r: listing.update(etag=r.headers.get('ETag')),
+            completion_hook=lambda n: listing.update(complete=True, pages=n)))
+        self._commit_orgs_listing(group_id, all_orgs, listing['etag'],
+                                  listing['complete'], listing['pages'])
         self.logger.info(f"Found {len(all_orgs)} total organizations")
         return all_orgs
+
+    def fetch_and_analyze_orgs(self, version: str, group_id: Optional[str],
+                               exclusions) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch and classify organizations in one pipelined pass.
+
+        Each page is analyzed while _paged_get's prefetch thread is already
+        fetching the next one, so classification adds no wall time on top of
+        pagination. Shares the ETag cache with get_snyk_orgs, and both lists
+        are fully materialized before returning so the confirmation prompt
+        still shows the complete picture before anything is deleted.
+        """
+        cached = self._cached_orgs_if_unchanged(version, group_id)
+        if cached is not None:
+            return self.analyze_orgs_for_deletion(cached, exclusions, group_id)
+
+        fetched = []
+        listing = {'etag': None, 'complete': False, 'pages': 0}
+
+        def stream():
+            for org in self.iter_snyk_orgs(
+                    version, group_id,
+                    first_response_hook=lambda r: listing.update(etag=r.headers.get('ETag')),
+                    completion_hook=lambda n: listing.update(complete=True, pages=n)):
+                fetched.append(org)
+                yield org
+
+        deletable, protected = self.analyze_orgs_for_deletion(stream(), exclusions, group_id)
+        self._commit_orgs_listing(group_id, fetched, listing['etag'],
+                                  listing['complete'], listing['pages'])
+        return deletable, protected
     
 
     
 
     
-    def delete_org(self, org_id: str) -> bool:
-        """Delete a Snyk organization."""
-        url = f"{self.base_url}/v1/org/{org_id}"
-        
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Check if we're in backoff
-                if self.rate_limiter.is_in_backoff():
-                    wait_time = 5 + random.uniform(0, 5)  # Random jitter
-                    time.sleep(wait_time)
-                
-                self.logger.info(f"Deleting organization {org_id}... (attempt {attempt + 1})")
-                self.logger.info(f"Delete URL: {url}")
-                
-                # Use specific headers for v1 delete endpoint
-                headers = {
-                    'Authorization': f'token {self.token}',
-                    'Accept': '*/*'
-                }
-                
-                response = self.session.delete(url, headers=headers)
-                
-                if response.status_code == 429:
-                    self.rate_limiter.handle_429(f"DELETE org {org_id}")
-                    continue
-                
-                # Log the response details for debugging
-                # 204 No Content is also a success status for DELETE operations
-                if response.status_code not in [200, 204]:
-                    self.logger.error(f"Delete failed with status {response.status_code}")
-                    try:
-                        error_data = response.json()
-                        self.logger.error(f"Error response: {error_data}")
-                        
-                        # Check if this is the specific error about projects needing to be deleted
-                        if (response.status_code == 400 and 
-                            isinstance(error_data, dict) and 
-                            'message' in error_data and
-                            'You must delete all projects in your organization before the organization can be deleted' in error_data['message']):
-                            
-                            self.logger.warning(f"Organization {org_id} still has projects. Attempting to delete them...")
-                            
-                            # Try to delete projects and then retry organization deletion
-                            project_results = self.delete_all_org_projects(org_id)
-                            
-                            if project_results['failed']:
-                                self.logger.error(f"Failed to delete {len(project_results['failed'])} projects. Cannot delete organization.")
-                                return False
-                            
-                            self.logger.info(f"Successfully deleted all projects. Retrying organization deletion...")
-                            time.sleep(2)  # Wait for project deletion to complete
-                            
-                            # Retry the organization deletion
-                            retry_response = self.session.delete(url, headers=headers)
-                            # 204 No Content is also a success status for DELETE operations
-                            if retry_response.status_code in [200, 204]:
-                                self.logger.info(f"Successfully deleted organization {org_id} after project cleanup")
-                                return True
-                            else:
-                                self.logger.error(f"Organization deletion still failed after project cleanup: {retry_response.status_code}")
-                                return False
-                        
-                    except:
-                        self.logger.error(f"Error response text: {response.text}")
-                
-                # 204 No Content is also a success status for DELETE operations
-                if response.status_code in [200, 204]:
-                    self.logger.info(f"Successfully deleted organization {org_id}")
-                    return True
-                
-                response.raise_for_status()
-                self.logger.info(f"Successfully deleted organization {org_id}")
+    def _retry_org_delete_after_cleanup(self, url: str, org_id: str, what: str,
+                                        cleanup_rounds: int = 0) -> bool:
+        """Re-attempt an org DELETE after project/target cleanup.
+
+        Deletion of children is eventually consistent, so rather than a fixed
+        sleep, retry immediately and back off 200ms, 400ms, 800ms... only
+        while the API still rejects the delete. The first success exits, so
+        the common immediately-consistent case pays no delay at all.
+
+        If the API still answers 400 once the backoff is exhausted, it may
+        now be reporting a different class of leftover children (e.g.
+        targets after a project pass), so re-dispatch through delete_org's
+        error parsing while cleanup_rounds permits.
+        """
+        delay = 0.2
+        response = None
+        for _ in range(5):
+            response = self._delete_with_retry(url, bucket='org', label=f"org {org_id}")
+            if response is not None and response.status_code in [200, 204]:
+                self.logger.info(f"Successfully deleted organization {org_id} after {what} cleanup")
                 return True
-                
-            except requests.exceptions.RequestException as e:
-                if response.status_code == 429:
-                    self.rate_limiter.handle_429(f"DELETE org {org_id}")
-                    continue
-                else:
-                    self.logger.error(f"Error deleting organization {org_id}: {e}")
-                    if attempt == max_retries - 1:
-                        return False
-                    time.sleep(1 + random.uniform(0, 2))  # Random backoff
-        
+            # Same idempotent-404 semantics as delete_org: the org vanished
+            # between attempts (e.g. a concurrent run finished it)
+            if response is not None and response.status_code == 404:
+                self._note_already_gone('Organization', org_id)
+                return True
+            if response is None or response.status_code not in [400, 409]:
+                break
+            time.sleep(delay)
+            delay *= 2
+
+        if cleanup_rounds > 0 and response is not None and response.status_code == 400:
+            self.logger.warning(
+                f"Organization {org_id} still rejected after {what} cleanup; re-checking the error for other leftover resources")
+            return self.delete_org(org_id, _cleanup_rounds=cleanup_rounds - 1)
+
+        self.logger.error(f"Organization deletion still failed after {what} cleanup: {response.status_code if response is not None else 'no response'}")
+        return False
+
+    def _note_already_gone(self, what: str, item_id: str):
+        """Tally a DELETE that found its item already gone (404), by type."""
+        with self._already_gone_lock:
+            self._already_gone[what] = self._already_gone.get(what, 0) + 1
+        self.logger.debug("%s %s not found (already deleted)", what, item_id)
+
+    def delete_org(self, org_id: str, _cleanup_rounds: int = 2) -> bool:
+        """Delete a Snyk organization.
+
+        _cleanup_rounds bounds how many child-cleanup passes may chain: an
+        org holding both projects and targets needs a second pass, because
+        the API only reports one class of leftover children at a time.
+        """
+        url = f"{self.base_url}/v1/org/{org_id}"
+
+        self.logger.info(f"Deleting organization {org_id}...")
+        self.logger.info(f"Delete URL: {url}")
+
+        response = self._delete_with_retry(url, bucket='org', label=f"org {org_id}")
+        if response is None:
+            return False
+
+        # 404 means the org is already gone (e.g. deleted by a previous
+        # partial run) - idempotent delete semantics, not a failure
+        if response.status_code == 404:
+            self._note_already_gone('Organization', org_id)
+            return True
+
+        # 204 No Content is also a success status for DELETE operations
+        if response.status_code in [200, 204]:
+            self.logger.info(f"Successfully deleted organization {org_id}")
+            return True
+
+        self.logger.error(f"Delete failed with status {response.status_code}")
+        try:
+            error_data = response.json()
+        except ValueError:
+            self.logger.error(f"Error response text: {response.text}")
+            return False
+        self.logger.error(f"Error response: {error_data}")
+
+        message = str(error_data.get('message', '')) if isinstance(error_data, dict) else ''
+
+        # Check if this is the specific error about projects needing to be deleted
+        if (response.status_code == 400 and
+            'You must delete all projects in your organization before the organization can be deleted' in message):
+
+            self.logger.warning(f"Organization {org_id} still has projects. Attempting to delete them...")
+
+            # Try to delete projects and then retry organization deletion
+            project_results = self.delete_all_org_projects(org_id)
+
+            if not project_results['successful_count'] and not project_results['failed']:
+                self.logger.error(f"Organization {org_id} reports remaining projects but none were returned. Not retrying.")
+                return False
+
+            if project_results['failed']:
+                self.logger.error(f"Failed to delete {len(project_results['failed'])} projects. Cannot delete organization.")
+                return False
+
+            self.logger.info(f"Successfully deleted all projects. Retrying organization deletion...")
+            return self._retry_org_delete_after_cleanup(url, org_id, 'project',
+                                                        cleanup_rounds=_cleanup_rounds)
+
+        # Same lazy cleanup for targets: only enumerate and delete them once
+        # the API tells us they're in the way
+        if response.status_code == 400 and 'target' in message.lower():
+            self.logger.warning(f"Organization {org_id} still has targets. Attempting to delete them...")
+
+            target_results = self.delete_all_org_targets(org_id)
+
+            if target_results['failed']:
+                self.logger.error(f"Failed to delete {len(target_results['failed'])} targets. Cannot delete organization.")
+                return False
+
+            self.logger.info(f"Successfully deleted all targets. Retrying organization deletion...")
+            return self._retry_org_delete_after_cleanup(url, org_id, 'target',
+                                                        cleanup_rounds=_cleanup_rounds)
+
         return False
     
 
@@ -287,8 +711,8 @@ class SnykOrgDeleter:
             self.logger.error(f"Error in delete_org_with_projects for {org_id}: {e}")
             return False
     
-    def load_exclusions(self, exclusions_file: str) -> List[str]:
-        """Load exclusion list from file."""
+    def load_exclusions(self, exclusions_file: str) -> frozenset:
+        """Load exclusion list from file as a set for O(1) membership checks."""
         exclusions = []
         try:
             with open(exclusions_file, 'r') as f:
@@ -301,35 +725,43 @@ class SnykOrgDeleter:
             self.logger.warning(f"Exclusions file {exclusions_file} not found. No organizations will be excluded.")
         except Exception as e:
             self.logger.error(f"Error loading exclusions file: {e}")
-        
-        return exclusions
+
+        return frozenset(exclusions)
     
-    def analyze_orgs_for_deletion(self, orgs: List[Dict], exclusions: List[str], group_id: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
-        """Analyze organizations and separate them into deletable and protected lists."""
+    def analyze_orgs_for_deletion(self, orgs: Iterable[Dict], exclusions, group_id: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Analyze organizations and separate them into deletable and protected lists.
+
+        Accepts any iterable, so a streaming source (iter_snyk_orgs) can be
+        classified page by page while later pages are still being fetched.
+        """
         deletable = []
         protected = []
-        
+
+        # Set membership keeps the loop linear even with large exclusion lists
+        exclusions = frozenset(exclusions)
+
         for org in orgs:
             org_id = org.get('id')
-            org_name = org.get('attributes', {}).get('name', 'Unknown')
-            
+            attrs = org.get('attributes') or _EMPTY
+            org_name = attrs.get('name', 'Unknown')
+
             # Check if org should be excluded
             if org_id in exclusions or org_name in exclusions:
                 protected.append(org)
-                self.logger.info(f"Organization '{org_name}' ({org_id}) is in exclusion list - PROTECTED")
+                self.logger.debug(f"Organization '{org_name}' ({org_id}) is in exclusion list - PROTECTED")
                 continue
-            
+
             # Check if org belongs to the specified group
-            if group_id:
-                org_group_id = org.get('attributes', {}).get('group_id')
-                if org_group_id != group_id:
-                    protected.append(org)
-                    self.logger.info(f"Organization '{org_name}' ({org_id}) belongs to different group - PROTECTED")
-                    continue
-            
+            if group_id and attrs.get('group_id') != group_id:
+                protected.append(org)
+                self.logger.debug(f"Organization '{org_name}' ({org_id}) belongs to different group - PROTECTED")
+                continue
+
             deletable.append(org)
-            self.logger.info(f"Organization '{org_name}' ({org_id}) marked for deletion")
-        
+            self.logger.debug(f"Organization '{org_name}' ({org_id}) marked for deletion")
+
+        self.logger.info(f"Analyzed {len(deletable) + len(protected)} organizations: "
+                         f"{len(deletable)} deletable, {len(protected)} protected")
         return deletable, protected
     
     def dry_run_deletion(self, deletable_orgs: List[Dict]) -> None:
@@ -346,8 +778,9 @@ class SnykOrgDeleter:
         
         for org in deletable_orgs:
             org_id = org.get('id')
-            org_name = org.get('attributes', {}).get('name', 'Unknown')
-            org_created = org.get('attributes', {}).get('created', 'Unknown')
+            attrs = org.get('attributes') or _EMPTY
+            org_name = attrs.get('name', 'Unknown')
+            org_created = attrs.get('created', 'Unknown')
             
             self.logger.info(f"  - {org_name} ({org_id})")
             self.logger.info(f"    Created: {org_created}")
@@ -365,409 +798,435 @@ class SnykOrgDeleter:
         print("\nOrganizations to be deleted:")
         
         for org in deletable_orgs:
-            org_name = org.get('attributes', {}).get('name', 'Unknown')
+            org_name = (org.get('attributes') or _EMPTY).get('name', 'Unknown')
             org_id = org.get('id')
             print(f"  - {org_name} ({org_id})")
         
         print(f"\nType 'DELETE {len(deletable_orgs)}' to confirm:")
-        confirmation = input("> ").strip()
-        
+        try:
+            confirmation = input("> ").strip()
+        except EOFError:
+            # Non-interactive stdin (daemon/CI): treat as declined instead
+            # of crashing the run
+            print("\n❌ No interactive input available; not confirmed. Use --yes for unattended runs.")
+            return False
+
         return confirmation == f"DELETE {len(deletable_orgs)}"
     
-    def execute_deletion(self, deletable_orgs: List[Dict]) -> Dict[str, List[str]]:
+    def execute_deletion(self, deletable_orgs: List[Dict]) -> Dict:
         """Execute the actual deletion of organizations using multi-threading."""
-        results = {
-            'successful': [],
-            'failed': []
-        }
-        
+        # Successes only ever feed a count, so track them with an atomic
+        # counter; only failures need their IDs kept for the final report
+        success_counter = itertools.count()
+        failed_ids = []
+
         self.logger.info("=" * 60)
         self.logger.info("EXECUTING DELETION")
         self.logger.info("=" * 60)
         
-        # Thread-safe results collection
-        results_lock = threading.Lock()
-        
         def delete_org_worker(org):
             """Worker function to delete a single organization with all its targets."""
             org_id = org.get('id')
-            org_name = org.get('attributes', {}).get('name', 'Unknown')
-            
+            org_name = (org.get('attributes') or _EMPTY).get('name', 'Unknown')
+
             self.logger.info(f"Processing organization: {org_name} ({org_id})")
-            
-            # Step 1: Delete all targets for the organization
-            self.logger.info(f"Step 1: Deleting all targets for organization {org_id}")
-            target_results = self.delete_all_org_targets(org_id)
-            
-            if target_results['failed']:
-                self.logger.warning(f"Some targets failed to delete: {len(target_results['failed'])} failures")
-                self.logger.warning("Proceeding with organization deletion anyway...")
-            
-            # Wait a moment for target deletion to complete
-            time.sleep(2)
-            
-            # Step 2: Now delete the organization
-            success = self.delete_org_with_projects(org_id)
-            
-            with results_lock:
-                if success:
-                    results['successful'].append(org_id)
-                    self.logger.info(f"✅ Successfully deleted {org_name}")
-                else:
-                    results['failed'].append(org_id)
-                    self.logger.error(f"❌ Failed to delete {org_name}")
-            
+
+            # Try the org delete directly; most orgs are empty, and delete_org
+            # lazily cleans up targets/projects only when the API rejects the
+            # delete because they still exist
+            try:
+                success = self.delete_org_with_projects(org_id)
+            except Exception as e:
+                self.logger.error(f"Exception in organization deletion worker for {org_name} ({org_id}): {e}")
+                success = False
+
+            # next() and list.append are atomic under the GIL; no lock needed
+            if success:
+                next(success_counter)
+                self.logger.info(f"✅ Successfully deleted {org_name}")
+            else:
+                failed_ids.append(org_id)
+                self.logger.error(f"❌ Failed to delete {org_name}")
+
             return success
-        
+
         # Use ThreadPoolExecutor for concurrent organization deletion
         # Use fewer workers for organizations since they're more resource-intensive
         org_workers = min(3, self.max_workers)
         self.logger.info(f"Using {org_workers} workers for organization deletion...")
-        
+
         with ThreadPoolExecutor(max_workers=org_workers) as executor:
-            # Submit all organization deletion tasks
-            future_to_org = {
-                executor.submit(delete_org_worker, org): org 
-                for org in deletable_orgs
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_org):
-                org = future_to_org[future]
-                try:
-                    future.result()  # This will raise any exceptions
-                except Exception as e:
-                    org_id = org.get('id')
-                    org_name = org.get('attributes', {}).get('name', 'Unknown')
-                    self.logger.error(f"Exception in organization deletion worker for {org_name} ({org_id}): {e}")
-                    with results_lock:
-                        results['failed'].append(org_id)
-        
+            # Keep a bounded window of in-flight deletions rather than
+            # queueing every org upfront: memory stays constant regardless
+            # of group size, and a rate-limit pause drains the window in
+            # seconds instead of leaving thousands of tasks queued
+            inflight = set()
+            for org in deletable_orgs:
+                while len(inflight) >= org_workers * 2:
+                    done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                inflight.add(executor.submit(delete_org_worker, org))
+
+            # Workers record their own results, so the drain just waits
+            wait(inflight)
+
+        results = {'successful_count': next(success_counter), 'failed': failed_ids}
+
         self.logger.info("=" * 60)
-        self.logger.info(f"Deletion completed. Successful: {len(results['successful'])}, Failed: {len(results['failed'])}")
+        self.logger.info(f"Deletion completed. Successful: {results['successful_count']}, Failed: {len(results['failed'])}")
+        # Report where concurrency settled so future runs can set
+        # --max-workers directly instead of rediscovering the ceiling
+        self.logger.info(f"Steady-state concurrency: {self.adaptive_limiter.permits} of {self.adaptive_limiter.cap} permits")
         self.logger.info("=" * 60)
         
         return results
 
+    def _iter_org_projects(self, org_id: str):
+        """Yield pages of projects for an organization."""
+        url = f"{self.base_url}/rest/orgs/{org_id}/projects"
+        # Sort by creation time so cursor paging stays stable while
+        # concurrent workers delete items from earlier pages.
+        params = {
+            'version': self.api_version,
+            'sort': 'created'
+        }
+        return self._paged_get(url, params, label=f"projects (org {org_id})")
+
     def get_org_projects(self, org_id: str) -> List[Dict]:
         """Get all projects for an organization."""
-        url = f"{self.base_url}/rest/orgs/{org_id}/projects"
-        params = {'version': '2024-10-15'}
-        
         all_projects = []
-        next_url = url
-        next_params = params
-        page = 1
-        
-        while next_url:
-            self.logger.info(f"Fetching projects page {page} for org {org_id}...")
-            try:
-                response = self.session.get(next_url, params=next_params)
-                response.raise_for_status()
-                data = response.json()
-                
-                projects = data.get('data', [])
-                all_projects.extend(projects)
-                
-                # Handle pagination
-                links = data.get('links', {})
-                next_url = links.get('next')
-                next_params = None
-                
-                if next_url:
-                    if next_url.startswith('http'):
-                        pass  # use as-is
-                    elif next_url.startswith('/'):
-                        next_url = self.base_url + next_url
-                    else:
-                        next_url = self.base_url + '/' + next_url.lstrip('/')
-                else:
-                    next_url = None
-                
-                page += 1
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error fetching projects page {page} for org {org_id}: {e}")
-                break
-        
+        for projects in self._iter_org_projects(org_id):
+            all_projects.extend(projects)
+
         self.logger.info(f"Found {len(all_projects)} total projects for org {org_id}")
         return all_projects
     
     def delete_project(self, org_id: str, project_id: str) -> bool:
         """Delete a specific project from an organization."""
         url = f"{self.base_url}/rest/orgs/{org_id}/projects/{project_id}"
-        params = {'version': '2024-10-15'}
-        
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Check if we're in backoff
-                if self.rate_limiter.is_in_backoff():
-                    wait_time = 5 + random.uniform(0, 5)  # Random jitter
-                    time.sleep(wait_time)
-                
-                self.logger.info(f"Deleting project {project_id} from org {org_id}... (attempt {attempt + 1})")
-                response = self.session.delete(url, params=params)
-                
-                if response.status_code == 429:
-                    self.rate_limiter.handle_429(f"DELETE project {project_id}")
-                    continue
-                
-                # 404 means project not found (already deleted) - treat as success
-                if response.status_code == 404:
-                    self.logger.debug(f"Project {project_id} not found (already deleted)")
-                    return True
-                
-                # 204 No Content is also a success status for DELETE operations
-                if response.status_code in [200, 204]:
-                    self.logger.info(f"Successfully deleted project {project_id} from org {org_id}")
-                    return True
-                
-                response.raise_for_status()
-                return True
-                
-            except requests.exceptions.RequestException as e:
-                if response.status_code == 429:
-                    self.rate_limiter.handle_429(f"DELETE project {project_id}")
-                    continue
-                elif response.status_code == 404:
-                    # Project not found - already deleted, treat as success
-                    self.logger.debug(f"Project {project_id} not found (already deleted)")
-                    return True
-                else:
-                    self.logger.error(f"Error deleting project {project_id} from org {org_id}: {e}")
-                    if attempt == max_retries - 1:
-                        return False
-                    time.sleep(1 + random.uniform(0, 2))  # Random backoff
-        
+
+        self.logger.debug("Deleting project %s from org %s...", project_id, org_id)
+        response = self._delete_with_retry(url, params=self._version_params, bucket='project',
+                                           label=f"project {project_id} (org {org_id})")
+        if response is None:
+            return False
+
+        # 404 means project not found (already deleted) - treat as success
+        if response.status_code == 404:
+            self._note_already_gone('Project', project_id)
+            return True
+
+        # 204 No Content is also a success status for DELETE operations
+        if response.status_code in [200, 204]:
+            self.logger.debug("Successfully deleted project %s from org %s", project_id, org_id)
+            return True
+
+        self.logger.error(f"Delete of project {project_id} failed with status {response.status_code}")
         return False
     
-    def delete_all_org_projects(self, org_id: str) -> Dict[str, List[str]]:
-        """Delete all projects in an organization using multi-threading."""
-        self.logger.info(f"Starting deletion of all projects for org {org_id}")
-        
-        # Get all projects
-        projects = self.get_org_projects(org_id)
-        
-        if not projects:
-            self.logger.info(f"No projects found for org {org_id}")
-            return {'successful': [], 'failed': []}
-        
-        results = {
-            'successful': [],
-            'failed': []
-        }
-        
-        self.logger.info(f"Deleting {len(projects)} projects from org {org_id} using {self.max_workers} workers...")
-        
-        # Thread-safe results collection
-        results_lock = threading.Lock()
-        
+    def delete_projects_bulk(self, org_id: str, project_ids: List[str]) -> bool:
+        """Attempt to delete a batch of projects in a single API call.
+
+        Returns True if the bulk endpoint accepted the whole batch. Returns
+        False when the endpoint is unavailable (404/405) or rejects the
+        request, in which case the caller should fall back to per-project
+        deletion. Unavailability is remembered so we only probe once per run.
+        """
+        if self._bulk_delete_unsupported or not project_ids:
+            return False
+
+        url = f"{self.base_url}/rest/orgs/{org_id}/projects"
+        payload = {'data': [{'id': pid, 'type': 'project'} for pid in project_ids]}
+
+        try:
+            response = self.session.delete(url, params=self._version_params,
+                                           headers=self._json_api_headers, json=payload)
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Bulk project delete request failed for org {org_id}: {e}")
+            return False
+
+        if response.status_code in [404, 405]:
+            self._bulk_delete_unsupported = True
+            self.logger.info("Bulk project deletion not supported by the API. Falling back to per-project deletes.")
+            return False
+
+        if response.status_code in [200, 202, 204]:
+            self.logger.info(f"Bulk deleted {len(project_ids)} projects from org {org_id}")
+            return True
+
+        self.logger.warning(f"Bulk project delete returned status {response.status_code} for org {org_id}. Falling back to per-project deletes.")
+        return False
+
+    def delete_all_org_projects(self, org_id: str) -> Dict:
+        """Delete all projects in an organization, streaming pages into workers."""
+        self.logger.info(f"Starting deletion of all projects for org {org_id} using {self.max_workers} workers...")
+        start_time = time.time()
+
+        success_counter = itertools.count()
+        failed_ids = []
+
         def delete_project_worker(project):
             """Worker function to delete a single project."""
+            attrs = project.get('attributes') or _EMPTY
             project_id = project.get('id')
-            project_name = project.get('attributes', {}).get('name', 'Unknown')
-            project_type = project.get('attributes', {}).get('type', 'Unknown')
-            
-            self.logger.info(f"Processing project: {project_name} ({project_id}) - Type: {project_type}")
-            
-            success = self.delete_project(org_id, project_id)
-            
-            with results_lock:
-                if success:
-                    results['successful'].append(project_id)
-                    self.logger.info(f"✅ Successfully deleted project {project_name}")
-                else:
-                    results['failed'].append(project_id)
-                    self.logger.error(f"❌ Failed to delete project {project_name}")
-            
+            project_name = attrs.get('name', 'Unknown')
+            project_type = attrs.get('type', 'Unknown')
+
+            self.logger.debug("Processing project: %s (%s) - Type: %s", project_name, project_id, project_type)
+
+            try:
+                success = self.delete_project(org_id, project_id)
+            except Exception as e:
+                self.logger.error(f"Exception in project deletion worker for {project_name} ({project_id}): {e}")
+                success = False
+
+            # next() and list.append are atomic under the GIL; no lock needed
+            if success:
+                next(success_counter)
+            else:
+                failed_ids.append(project_id)
+
             return success
-        
-        # Use ThreadPoolExecutor for concurrent project deletion
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all project deletion tasks
-            future_to_project = {
-                executor.submit(delete_project_worker, project): project 
-                for project in projects
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_project):
-                project = future_to_project[future]
-                try:
-                    future.result()  # This will raise any exceptions
-                except Exception as e:
-                    project_id = project.get('id')
-                    project_name = project.get('attributes', {}).get('name', 'Unknown')
-                    self.logger.error(f"Exception in project deletion worker for {project_name} ({project_id}): {e}")
-                    with results_lock:
-                        results['failed'].append(project_id)
-        
-        self.logger.info(f"Project deletion completed for org {org_id}. Successful: {len(results['successful'])}, Failed: {len(results['failed'])}")
+
+        def pages_after_bulk():
+            """Yield only the pages that still need per-project deletion."""
+            for page in self._iter_org_projects(org_id):
+                project_ids = [p.get('id') for p in page]
+                if self.delete_projects_bulk(org_id, project_ids):
+                    for _ in project_ids:
+                        next(success_counter)
+                else:
+                    yield page
+
+        # Stream pages into the workers so deletion overlaps with listing
+        self._stream_delete(pages_after_bulk(), delete_project_worker)
+
+        results = {'successful_count': next(success_counter), 'failed': failed_ids}
+        self.logger.info("org=%s projects_deleted=%d failed=%d duration=%.2fs",
+                         org_id, results['successful_count'], len(results['failed']),
+                         time.time() - start_time)
         return results
 
-    def get_org_targets(self, org_id: str) -> List[Dict]:
-        """Get all targets for an organization."""
+    def _iter_org_targets(self, org_id: str):
+        """Yield pages of targets for an organization."""
         url = f"{self.base_url}/rest/orgs/{org_id}/targets"
+        # Sort by creation time so cursor paging stays stable while
+        # concurrent workers delete items from earlier pages.
         params = {
-            'version': '2024-10-15',
-            'limit': 100
+            'version': self.api_version,
+            'limit': 100,
+            'sort': 'created'
         }
-        
+        return self._paged_get(url, params, label=f"targets (org {org_id})")
+
+    def get_org_targets(self, org_id: str) -> List[Dict]:
+        """Get all targets for an organization."""
         all_targets = []
-        next_url = url
-        next_params = params
-        page = 1
-        
-        while next_url:
-            self.logger.info(f"Fetching targets page {page} for org {org_id}...")
-            try:
-                response = self.session.get(next_url, params=next_params)
-                response.raise_for_status()
-                data = response.json()
-                
-                targets = data.get('data', [])
-                all_targets.extend(targets)
-                
-                # Handle pagination
-                links = data.get('links', {})
-                next_url = links.get('next')
-                next_params = None
-                
-                if next_url:
-                    if next_url.startswith('http'):
-                        pass  # use as-is
-                    elif next_url.startswith('/'):
-                        next_url = self.base_url + next_url
-                    else:
-                        next_url = self.base_url + '/' + next_url.lstrip('/')
-                else:
-                    next_url = None
-                
-                page += 1
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error fetching targets page {page} for org {org_id}: {e}")
-                break
-        
+        for targets in self._iter_org_targets(org_id):
+            all_targets.extend(targets)
+
         self.logger.info(f"Found {len(all_targets)} total targets for org {org_id}")
         return all_targets
     
     def delete_target(self, org_id: str, target_id: str) -> bool:
         """Delete a specific target from an organization."""
         url = f"{self.base_url}/rest/orgs/{org_id}/targets/{target_id}"
-        params = {'version': '2024-10-15'}
-        
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Check if we're in backoff
-                if self.rate_limiter.is_in_backoff():
-                    wait_time = 5 + random.uniform(0, 5)  # Random jitter
-                    time.sleep(wait_time)
-                
-                self.logger.info(f"Deleting target {target_id} from org {org_id}... (attempt {attempt + 1})")
-                response = self.session.delete(url, params=params)
-                
-                if response.status_code == 429:
-                    self.rate_limiter.handle_429(f"DELETE target {target_id}")
-                    continue
-                
-                # 404 means target not found (already deleted) - treat as success
-                if response.status_code == 404:
-                    self.logger.debug(f"Target {target_id} not found (already deleted)")
-                    return True
-                
-                # 204 No Content is also a success status for DELETE operations
-                if response.status_code in [200, 204]:
-                    self.logger.info(f"Successfully deleted target {target_id} from org {org_id}")
-                    return True
-                
-                response.raise_for_status()
-                return True
-                
-            except requests.exceptions.RequestException as e:
-                if response.status_code == 429:
-                    self.rate_limiter.handle_429(f"DELETE target {target_id}")
-                    continue
-                elif response.status_code == 404:
-                    # Target not found - already deleted, treat as success
-                    self.logger.debug(f"Target {target_id} not found (already deleted)")
-                    return True
-                else:
-                    self.logger.error(f"Error deleting target {target_id} from org {org_id}: {e}")
-                    if attempt == max_retries - 1:
-                        return False
-                    time.sleep(1 + random.uniform(0, 2))  # Random backoff
-        
+
+        self.logger.debug("Deleting target %s from org %s...", target_id, org_id)
+        response = self._delete_with_retry(url, params=self._version_params, bucket='target',
+                                           label=f"target {target_id} (org {org_id})")
+        if response is None:
+            return False
+
+        # 404 means target not found (already deleted) - treat as success
+        if response.status_code == 404:
+            self._note_already_gone('Target', target_id)
+            return True
+
+        # 204 No Content is also a success status for DELETE operations
+        if response.status_code in [200, 204]:
+            self.logger.debug("Successfully deleted target %s from org %s", target_id, org_id)
+            return True
+
+        self.logger.error(f"Delete of target {target_id} failed with status {response.status_code}")
         return False
     
-    def delete_all_org_targets(self, org_id: str) -> Dict[str, List[str]]:
-        """Delete all targets in an organization using multi-threading."""
-        self.logger.info(f"Starting deletion of all targets for org {org_id}")
-        
-        # Get all targets
-        targets = self.get_org_targets(org_id)
-        
-        if not targets:
-            self.logger.info(f"No targets found for org {org_id}")
-            return {'successful': [], 'failed': []}
-        
-        results = {
-            'successful': [],
-            'failed': []
-        }
-        
-        self.logger.info(f"Deleting {len(targets)} targets from org {org_id} using {self.max_workers} workers...")
-        
-        # Thread-safe results collection
-        results_lock = threading.Lock()
-        
+    def _interleave_by_origin(self, targets: List[Dict]) -> List[Dict]:
+        """Round-robin targets across their integrations.
+
+        Snyk throttles some integrations (e.g. SCM apps) server-side, so a
+        long run of same-origin targets can tie up every worker behind one
+        slow integration. Interleaving keeps each worker batch mixed so a
+        slow origin only ever holds a fraction of the pool.
+        """
+        buckets = defaultdict(list)
+        for target in targets:
+            buckets[(target.get('attributes') or _EMPTY).get('origin', '_')].append(target)
+
+        if len(buckets) <= 1:
+            return targets
+
+        interleaved = []
+        for group in itertools.zip_longest(*buckets.values()):
+            interleaved.extend(target for target in group if target is not None)
+        return interleaved
+
+    def delete_targets_bulk(self, org_id: str, target_ids: List[str]) -> bool:
+        """Attempt to delete a batch of targets in a single API call.
+
+        Mirrors delete_projects_bulk: returns True when the bulk endpoint
+        accepted the whole batch, False when it is unavailable or rejects
+        the request, in which case the caller falls back to per-target
+        deletion. Unavailability is remembered so we only probe once per run.
+        """
+        if self._bulk_target_delete_unsupported or not target_ids:
+            return False
+
+        url = f"{self.base_url}/rest/orgs/{org_id}/targets"
+        payload = {'data': [{'id': tid, 'type': 'target'} for tid in target_ids]}
+
+        try:
+            response = self.session.delete(url, params=self._version_params,
+                                           headers=self._json_api_headers, json=payload)
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Bulk target delete request failed for org {org_id}: {e}")
+            return False
+
+        if response.status_code in [404, 405]:
+            self._bulk_target_delete_unsupported = True
+            self.logger.info("Bulk target deletion not supported by the API. Falling back to per-target deletes.")
+            return False
+
+        if response.status_code in [200, 202, 204]:
+            self.logger.info(f"Bulk deleted {len(target_ids)} targets from org {org_id}")
+            return True
+
+        self.logger.warning(f"Bulk target delete returned status {response.status_code} for org {org_id}. Falling back to per-target deletes.")
+        return False
+
+    def delete_all_org_targets(self, org_id: str) -> Dict:
+        """Delete all targets in an organization, streaming pages into workers."""
+        self.logger.info(f"Starting deletion of all targets for org {org_id} using {self.max_workers} workers...")
+        start_time = time.time()
+
+        success_counter = itertools.count()
+        failed_ids = []
+
         def delete_target_worker(target):
             """Worker function to delete a single target."""
+            attrs = target.get('attributes') or _EMPTY
             target_id = target.get('id')
-            target_name = target.get('attributes', {}).get('display_name', 'Unknown')
-            target_url = target.get('attributes', {}).get('url', 'Unknown')
-            
-            self.logger.info(f"Processing target: {target_name} ({target_id})")
-            self.logger.info(f"  URL: {target_url}")
-            
-            success = self.delete_target(org_id, target_id)
-            
-            with results_lock:
-                if success:
-                    results['successful'].append(target_id)
-                    self.logger.info(f"✅ Successfully deleted target {target_name}")
-                else:
-                    results['failed'].append(target_id)
-                    self.logger.error(f"❌ Failed to delete target {target_name}")
-            
+            target_name = attrs.get('display_name', 'Unknown')
+            target_url = attrs.get('url', 'Unknown')
+
+            self.logger.debug("Processing target: %s (%s)", target_name, target_id)
+            self.logger.debug("  URL: %s", target_url)
+
+            try:
+                success = self.delete_target(org_id, target_id)
+            except Exception as e:
+                self.logger.error(f"Exception in target deletion worker for {target_name} ({target_id}): {e}")
+                success = False
+
+            # next() and list.append are atomic under the GIL; no lock needed
+            if success:
+                next(success_counter)
+            else:
+                failed_ids.append(target_id)
+
             return success
-        
-        # Use ThreadPoolExecutor for concurrent deletion
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all target deletion tasks
-            future_to_target = {
-                executor.submit(delete_target_worker, target): target 
-                for target in targets
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_target):
-                target = future_to_target[future]
-                try:
-                    future.result()  # This will raise any exceptions
-                except Exception as e:
-                    target_id = target.get('id')
-                    target_name = target.get('attributes', {}).get('display_name', 'Unknown')
-                    self.logger.error(f"Exception in target deletion worker for {target_name} ({target_id}): {e}")
-                    with results_lock:
-                        results['failed'].append(target_id)
-        
-        self.logger.info(f"Target deletion completed for org {org_id}. Successful: {len(results['successful'])}, Failed: {len(results['failed'])}")
+
+        def pages_after_bulk():
+            """Yield only the pages that still need per-target deletion."""
+            for page in self._iter_org_targets(org_id):
+                remaining = []
+                for start in range(0, len(page), self.batch_size):
+                    chunk = page[start:start + self.batch_size]
+                    chunk_ids = [t.get('id') for t in chunk]
+                    if self.delete_targets_bulk(org_id, chunk_ids):
+                        for _ in chunk_ids:
+                            next(success_counter)
+                    else:
+                        remaining.extend(chunk)
+                if remaining:
+                    yield self._interleave_by_origin(remaining)
+
+        # Stream pages into the workers so deletion overlaps with listing
+        self._stream_delete(pages_after_bulk(), delete_target_worker)
+
+        results = {'successful_count': next(success_counter), 'failed': failed_ids}
+        self.logger.info("org=%s targets_deleted=%d failed=%d duration=%.2fs",
+                         org_id, results['successful_count'], len(results['failed']),
+                         time.time() - start_time)
         return results
 
 
+def run_once(deleter: SnykOrgDeleter, args, exclusions) -> int:
+    """Run one fetch/analyze/delete cycle. Returns an exit code."""
+    # Fetch and analyze organizations in one pipelined pass: pages are
+    # classified while the next page is still in flight
+    print(f"🔍 Fetching and analyzing organizations for group {args.group_id}...")
+    deletable, protected = deleter.fetch_and_analyze_orgs(args.version, args.group_id, exclusions)
+
+    if not deletable and not protected:
+        print("❌ No organizations found for the specified group.")
+        return 1
+
+    print(f"\n📋 Summary:")
+    print(f"  Total organizations: {len(deletable) + len(protected)}")
+    print(f"  Protected: {len(protected)}")
+    print(f"  Deletable: {len(deletable)}")
+
+    if not deletable:
+        print("\n✅ No organizations to delete. All organizations are protected.")
+        return 0
+
+    # Dry run mode
+    if args.dry_run:
+        deleter.dry_run_deletion(deletable)
+        return 0
+
+    # Get confirmation
+    if args.yes:
+        print(f"\n⚠️  --yes given: deleting {len(deletable)} organizations without interactive confirmation!")
+        deleter.logger.warning(
+            f"--yes given: deleting {len(deletable)} organizations without interactive confirmation")
+    elif not deleter.confirm_deletion(deletable):
+        print("\n❌ Deletion cancelled by user.")
+        return 0
+
+    # Execute deletion
+    already_gone_before = dict(deleter._already_gone)
+    results = deleter.execute_deletion(deletable)
+
+    # Final summary
+    print(f"\n🎯 Final Results:")
+    print(f"  Successfully deleted: {results['successful_count']}")
+    print(f"  Failed to delete: {len(results['failed'])}")
+    # The org line stays org-only; child-cleanup 404s get their own line so
+    # the reader never mistakes project/target counts for org counts
+    gone = {what: count - already_gone_before.get(what, 0)
+            for what, count in deleter._already_gone.items()}
+    if gone.get('Organization'):
+        print(f"  Organizations already gone (deleted by an earlier run): {gone['Organization']}")
+    children_gone = {what: n for what, n in gone.items()
+                     if what != 'Organization' and n}
+    if children_gone:
+        detail = ", ".join(f"{n} {what.lower()}s"
+                           for what, n in sorted(children_gone.items()))
+        print(f"  Already-deleted children skipped during cleanup: {detail}")
+
+    if results['failed']:
+        print(f"\n❌ Failed deletions:")
+        for org_id in results['failed']:
+            print(f"  - {org_id}")
+        return 1
+
+    print("\n✅ All organizations deleted successfully!")
+    return 0
+
+
 def main():
     """Main function to run the organization deletion process."""
     parser = argparse.ArgumentParser(
@@ -796,13 +1255,19 @@ Examples:
                        choices=['SNYK-US-01', 'SNYK-US-02', 'SNYK-EU-01', 'SNYK-AU-01'],
                        help='Snyk region (default: SNYK-US-01)')
     parser.add_argument('--max-workers', type=int, default=5, help='Maximum number of concurrent workers for target deletion (default: 5)')
+    parser.add_argument('--batch-size', type=int, default=250, help='Maximum items per bulk delete request, when the API supports bulk deletion (default: 250)')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be deleted without actually deleting')
     parser.add_argument('--version', default='2024-10-15', help='API version (default: 2024-10-15)')
-    
+    parser.add_argument('--verbose', action='store_true', help='Enable per-item DEBUG logging')
+    parser.add_argument('--yes', action='store_true', help='Skip the interactive confirmation prompt (required for unattended --daemon runs that actually delete)')
+    parser.add_argument('--daemon', action='store_true', help='Keep running, repeating the cycle every --interval seconds')
+    parser.add_argument('--interval', type=int, default=3600, help='Seconds between cycles in daemon mode (default: 3600)')
+
     args = parser.parse_args()
-    
+
     # Initialize the deleter
-    deleter = SnykOrgDeleter(args.token, args.region, args.max_workers)
+    deleter = SnykOrgDeleter(args.token, args.region, args.max_workers, args.verbose,
+                             batch_size=args.batch_size, api_version=args.version)
     
     # Verify token
     token_details = deleter.get_token_details(args.version)
@@ -814,53 +1279,21 @@ Examples:
     
     # Load exclusions
     exclusions = deleter.load_exclusions(args.exclusions)
-    
-    # Get all organizations
-    print(f"🔍 Fetching organizations for group {args.group_id}...")
-    orgs = deleter.get_snyk_orgs(args.version, args.group_id)
-    
-    if not orgs:
-        print("❌ No organizations found for the specified group.")
-        sys.exit(1)
-    
-    # Analyze organizations
-    print("📊 Analyzing organizations...")
-    deletable, protected = deleter.analyze_orgs_for_deletion(orgs, exclusions, args.group_id)
-    
-    print(f"\n📋 Summary:")
-    print(f"  Total organizations: {len(orgs)}")
-    print(f"  Protected: {len(protected)}")
-    print(f"  Deletable: {len(deletable)}")
-    
-    if not deletable:
-        print("\n✅ No organizations to delete. All organizations are protected.")
-        sys.exit(0)
-    
-    # Dry run mode
-    if args.dry_run:
-        deleter.dry_run_deletion(deletable)
-        sys.exit(0)
-    
-    # Get confirmation
-    if not deleter.confirm_deletion(deletable):
-        print("\n❌ Deletion cancelled by user.")
-        sys.exit(0)
-    
-    # Execute deletion
-    results = deleter.execute_deletion(deletable)
-    
-    # Final summary
-    print(f"\n🎯 Final Results:")
-    print(f"  Successfully deleted: {len(results['successful'])}")
-    print(f"  Failed to delete: {len(results['failed'])}")
-    
-    if results['failed']:
-        print(f"\n❌ Failed deletions:")
-        for org_id in results['failed']:
-            print(f"  - {org_id}")
-        sys.exit(1)
-    else:
-        print("\n✅ All organizations deleted successfully!")
+
+    if not args.daemon:
+        sys.exit(run_once(deleter, args, exclusions))
+
+    # Daemon mode: reuse the same deleter (and its warm session, connection
+    # pool and org-listing ETag cache) across cycles. Confirmation still
+    # applies each cycle unless --dry-run is given.
+    print(f"🔁 Daemon mode: repeating every {args.interval}s. Press Ctrl+C to stop.")
+    try:
+        while True:
+            run_once(deleter, args, exclusions)
+            deleter.logger.info(f"Daemon cycle complete; sleeping {args.interval}s")
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n👋 Daemon stopped.")
         sys.exit(0)
 
 